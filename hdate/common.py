@@ -1,12 +1,44 @@
 """Small helper classes."""
 
 import datetime
+import functools
 import sys
 
 import pytz
 
 from hdate.htables import Months
 
+try:
+    from functools import lru_cache  # pylint: disable=unused-import
+except ImportError:  # pragma: no cover
+
+    def lru_cache(maxsize=128):
+        """Memoize a function of hashable positional arguments.
+
+        Minimal stand-in for functools.lru_cache on Python 2.7. Once maxsize
+        results are stored, the cache is emptied instead of evicting only the
+        least recently used entry.
+        """
+
+        def decorator(func):
+            cache = {}
+
+            @functools.wraps(func)
+            def wrapper(*args):
+                try:
+                    return cache[args]
+                except KeyError:
+                    pass
+                if maxsize is not None and len(cache) >= maxsize:
+                    cache.clear()
+                result = cache[args] = func(*args)
+                return result
+
+            wrapper.cache_clear = cache.clear
+            return wrapper
+
+        return decorator
+
 
 class BaseClass(object):  # pylint: disable=useless-object-inheritance
     """Implement basic functionality for all classes."""
@@ -26,9 +58,17 @@ class BaseClass(object):  # pylint: disable=useless-object-inheritance
     def __eq__(self, other):
         """Override equality operator."""
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return self._state() == other._state()
         return False
 
+    def _state(self):
+        """Return the attributes defining the object, ignoring memoized values."""
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if not key.endswith("_cache")
+        }
+
     def __ne__(self, other):
         """Override inequality operator."""
         return not self.__eq__(other)
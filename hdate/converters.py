@@ -6,7 +6,7 @@ from __future__ import division
 
 import datetime
 
-from hdate.common import HebrewDate
+from hdate.common import HebrewDate, lru_cache
 from hdate.htables import Months
 
 
@@ -20,7 +20,11 @@ PARTS_IN_DAY = 24 * PARTS_IN_HOUR
 PARTS_IN_WEEK = 7 * PARTS_IN_DAY
 PARTS_IN_MONTH = PARTS_IN_DAY + get_chalakim(12, 793)  # Fix for regular month
 
+# datetime's proleptic Gregorian ordinals count days from 1/1/1, JDN 1721426
+JDN_OF_GREGORIAN_ORDINAL_0 = 1721425
 
+
+@lru_cache(maxsize=1024)
 def _days_from_3744(hebrew_year):
     """Return: Number of days since 3,1,3744."""
     # Start point for calculation is Molad new year 3744 (16BC)
@@ -77,6 +81,7 @@ def _days_from_3744(hebrew_year):
     return days
 
 
+@lru_cache(maxsize=1024)
 def get_size_of_hebrew_year(hebrew_year):
     """Return: total days in hebrew year."""
     return _days_from_3744(hebrew_year + 1) - _days_from_3744(hebrew_year)
@@ -86,20 +91,9 @@ def gdate_to_jdn(date):
     """
     Compute Julian day from Gregorian day, month and year.
 
-    Algorithm from wikipedia's julian_day article.
     Return: The julian day number
     """
-    not_jan_or_feb = (14 - date.month) // 12
-    year_since_4800bc = date.year + 4800 - not_jan_or_feb
-    month_since_4800bc = date.month + 12 * not_jan_or_feb - 3
-    jdn = (
-        date.day
-        + (153 * month_since_4800bc + 2) // 5
-        + 365 * year_since_4800bc
-        + (year_since_4800bc // 4 - year_since_4800bc // 100 + year_since_4800bc // 400)
-        - 32045
-    )
-    return jdn
+    return date.toordinal() + JDN_OF_GREGORIAN_ORDINAL_0
 
 
 def hdate_to_jdn(date):
@@ -110,19 +104,24 @@ def hdate_to_jdn(date):
             1 of tishrey julians,
             1 of tishrey julians next year
     """
-    day = date.day
-    month = date.month.value
-    if date.month == Months.Adar_I:
+    return _hdate_to_jdn(date.year, date.month, date.day)
+
+
+@lru_cache(maxsize=4096)
+def _hdate_to_jdn(year, hebrew_month, day):
+    """Compute Julian day from Hebrew year, month (as Months) and day."""
+    month = hebrew_month.value
+    if hebrew_month == Months.Adar_I:
         month = 6
-    if date.month == Months.Adar_II:
+    if hebrew_month == Months.Adar_II:
         month = 6
         day += 30
 
     # Calculate days since 1,1,3744
-    day = _days_from_3744(date.year) + (59 * (month - 1) + 1) // 2 + day
+    day = _days_from_3744(year) + (59 * (month - 1) + 1) // 2 + day
 
     # length of year
-    length_of_year = get_size_of_hebrew_year(date.year)
+    length_of_year = get_size_of_hebrew_year(year)
     # Special cases for this year
     if length_of_year % 10 > 4 and month > 2:  # long Heshvan
         day += 1
@@ -139,27 +138,9 @@ def jdn_to_gdate(jdn):
     """
     Convert from the Julian day to the Gregorian day.
 
-    Algorithm from 'Julian and Gregorian Day Numbers' by Peter Meyer.
-    Return: day, month, year
+    Return: The gregorian date
     """
-    # pylint: disable=invalid-name
-
-    # The algorithm is a verbatim copy from Peter Meyer's article
-    # No explanation in the article is given for the variables
-    # Hence the exceptions for pylint and for flake8 (E741)
-
-    l = jdn + 68569  # noqa: E741
-    n = (4 * l) // 146097
-    l = l - (146097 * n + 3) // 4  # noqa: E741
-    i = (4000 * (l + 1)) // 1461001  # that's 1,461,001
-    l = l - (1461 * i) // 4 + 31  # noqa: E741
-    j = (80 * l) // 2447
-    day = l - (2447 * j) // 80
-    l = j // 11  # noqa: E741
-    month = j + 2 - (12 * l)
-    year = 100 * (n - 49) + i + l  # that's a lower-case L
-
-    return datetime.date(year, month, day)
+    return datetime.date.fromordinal(jdn - JDN_OF_GREGORIAN_ORDINAL_0)
 
 
 def jdn_to_hdate(jdn):
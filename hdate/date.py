@@ -10,15 +10,165 @@ from __future__ import division
 
 import datetime
 import logging
+from bisect import bisect_right
+from collections import namedtuple
 from itertools import chain, product
 
 from hdate import converters as conv
 from hdate import htables
-from hdate.common import BaseClass, HebrewDate
+from hdate.common import BaseClass, HebrewDate, lru_cache
 from hdate.htables import HolidayTypes, Months
 
 _LOGGER = logging.getLogger(__name__)
-# pylint: disable=too-many-public-methods
+
+# Hebrew day of week (Sunday = 1) indexed by datetime's weekday (Monday = 0)
+_DOW_BY_WEEKDAY = (2, 3, 4, 5, 6, 7, 1)
+# Days until the next (or current) Saturday indexed by datetime's weekday
+_DAYS_TO_SATURDAY = (5, 4, 3, 2, 1, 0, 6)
+# Sizes of the (regular and leap) years in which Kislev has only 29 days
+_SHORT_KISLEV_YEAR_SIZES = frozenset((353, 383))
+
+
+def _holidays_for_location(diaspora):
+    """Return the holidays which are observed in Israel or in the diaspora."""
+    return tuple(
+        holiday
+        for holiday in htables.HOLIDAYS
+        if holiday.israel_diaspora == ""
+        or (holiday.israel_diaspora == "DIASPORA") == diaspora
+    )
+
+
+# The holidays table only depends on the location, build both variants once
+_HOLIDAYS_BY_LOCATION = {
+    diaspora: _holidays_for_location(diaspora) for diaspora in (False, True)
+}
+
+
+def _holiday_dates_cross_product(holiday):
+    """Given a (days, months) pair, compute the cross product.
+
+    If days and/or months are singletons, they are converted to a list.
+    """
+    return product(*([x] if isinstance(x, (int, Months)) else x for x in holiday.date))
+
+
+def _holidays_by_date(holidays):
+    """Index the given holidays by each (day, month) pair they may fall on."""
+    index = {}
+    for holiday in holidays:
+        if len(holiday.date) < 2:
+            continue
+        for date in _holiday_dates_cross_product(holiday):
+            index.setdefault(date, []).append(holiday)
+    return {date: tuple(entries) for date, entries in index.items()}
+
+
+# Candidate holidays per location and (day, month), so that looking up the
+# holiday of a date only evaluates the predicates of the few matching entries
+_HOLIDAYS_BY_DATE = {
+    diaspora: _holidays_by_date(holidays)
+    for diaspora, holidays in _HOLIDAYS_BY_LOCATION.items()
+}
+
+
+def _daf_yomi_mesechta_starts():
+    """Return the offset of the first page of each mesechta within a cycle."""
+    starts = []
+    total = 0
+    for mesechta in htables.DAF_YOMI_MESECHTOS:
+        starts.append(total)
+        total += mesechta.pages
+    return tuple(starts)
+
+
+_DAF_YOMI_MESECHTA_STARTS = _daf_yomi_mesechta_starts()
+
+_YearInfo = namedtuple(
+    "YEAR_INFO", ["size", "rosh_hashana_jdn", "rosh_hashana_dow", "pesach_dow"]
+)
+
+_YearReadings = namedtuple(
+    "YEAR_READINGS",
+    [
+        "rosh_hashana_jdn",
+        "rosh_hashana_dow",
+        "readings",
+        "vezot_haberacha_days",
+        "year_type",
+    ],
+)
+
+
+def _is_vezot_haberacha(days, rosh_hashana_dow, diaspora):
+    """Return whether Vezot Haberacha is read a given number of days after RH."""
+    weeks = (days + rosh_hashana_dow - 1) // 7
+    dow = (days + rosh_hashana_dow - 1) % 7 + 1
+
+    # If it's currently Simchat Torah, return VeZot Haberacha.
+    if weeks == 3:
+        return days <= 22 and diaspora and dow != 7 or days <= 21 and not diaspora
+
+    # Special case for Simchat Torah in diaspora.
+    return weeks == 4 and days == 22 and diaspora
+
+
+@lru_cache(maxsize=512)
+def _holiday_entry_for_date(year, month, day, diaspora):
+    """Return the holidays table entry of a Hebrew date.
+
+    Memoized by date so that neighbouring days looked up by different HDate
+    instances (e.g. while walking a multi-day Yom Tov) share the result.
+    """
+    # pylint: disable=protected-access
+    hdate = HDate(heb_date=HebrewDate(year, month, day), diaspora=diaspora)
+    return hdate._lookup_holiday_entry()
+
+
+@lru_cache(maxsize=64)
+def _year_info(year):
+    """Return the size, Rosh Hashana JDN and weekday and Pesach weekday of a year."""
+    rosh_hashana_jdn = conv.hdate_to_jdn(HebrewDate(year, Months.Tishrei, 1))
+    pesach_jdn = conv.hdate_to_jdn(HebrewDate(year, Months.Nisan, 15))
+    return _YearInfo(
+        conv.get_size_of_hebrew_year(year),
+        rosh_hashana_jdn,
+        (rosh_hashana_jdn + 1) % 7 + 1,
+        (pesach_jdn + 1) % 7 + 1,
+    )
+
+
+@lru_cache(maxsize=64)
+def _year_readings(year, diaspora):
+    """Return the information needed to look up the readings of a year.
+
+    None of it depends on the date within the year, so it is shared by every
+    date of the given year and location.
+    """
+    info = _year_info(year)
+    rosh_hashana_dow = info.rosh_hashana_dow
+    pesach_dow = info.pesach_dow
+
+    _year_type = (info.size % 10) - 3
+    year_type = diaspora * 1000 + rosh_hashana_dow * 100 + _year_type * 10 + pesach_dow
+
+    # Simchat Torah is always within the first month of the year
+    vezot_haberacha_days = frozenset(
+        days
+        for days in range(30)
+        if _is_vezot_haberacha(days, rosh_hashana_dow, diaspora)
+    )
+
+    return _YearReadings(
+        info.rosh_hashana_jdn,
+        rosh_hashana_dow,
+        htables.READINGS[year_type],
+        vezot_haberacha_days,
+        year_type,
+    )
+
+
+# pylint: disable=too-many-public-methods,too-many-instance-attributes
 
 
 class HDate(BaseClass):
@@ -28,43 +178,78 @@ class HDate(BaseClass):
     Supports converting from Gregorian and Julian to Hebrew date.
     """
 
-    def __init__(
-        self, gdate=datetime.date.today(), diaspora=False, hebrew=True, heb_date=None
-    ):
-        """Initialize the HDate object."""
+    def __init__(self, gdate=None, diaspora=False, hebrew=True, heb_date=None):
+        """Initialize the HDate object.
+
+        If neither gdate nor heb_date are given, the date defaults to today.
+        """
         # Create private variables
         self._hdate = None
         self._gdate = None
         self._last_updated = None
+        self._diaspora = diaspora
+        self._hebrew = hebrew
+        self._date_key_cache = None
+        self._hdate_cache = None
+        self._gdate_cache = None
+        self._jdn_cache = None
+        self._upcoming_shabbat_cache = None
+        self._upcoming_yom_tov_cache = None
+        self._unicode_cache = None
+        self._reading_cache = None
 
         # Assign values
         # Keep hdate after gdate assignment so as not to cause recursion error
         if heb_date is None:
-            self.gdate = gdate
+            self.gdate = datetime.date.today() if gdate is None else gdate
             self.hdate = None
         else:
             self.gdate = None
             self.hdate = heb_date
-        self.hebrew = hebrew
-        self.diaspora = diaspora
+
+    @classmethod
+    def _from_converted_dates(cls, gdate, hdate, jdn, diaspora, hebrew):
+        """Return the HDate of a day whose Hebrew date and JDN are known.
+
+        The result is equal to HDate(gdate, diaspora, hebrew), but does not
+        convert the Gregorian date again.
+        """
+        # pylint: disable=too-many-arguments,protected-access
+        day = cls(heb_date=hdate, diaspora=diaspora, hebrew=hebrew)
+        day._gdate = gdate
+        day._date_key_cache = (hdate.year, hdate.month, hdate.day)
+        day._jdn_cache = jdn
+        day._gdate_cache = gdate
+        return day
 
     def __unicode__(self):
         """Return a full Unicode representation of HDate."""
+        self._validate_cache()
+        if self._unicode_cache is None:
+            self._unicode_cache = self._format_unicode()
+        return self._unicode_cache
+
+    def _format_unicode(self):
+        """Build the full Unicode representation of HDate."""
+        hebrew = self.hebrew
+        hdate = self.hdate
         result = u"{}{} {} {}{} {}".format(
-            u"יום " if self.hebrew else u"",
-            htables.DAYS[self.dow - 1][self.hebrew][0],
-            hebrew_number(self.hdate.day, hebrew=self.hebrew),
-            u"ב" if self.hebrew else u"",
-            htables.MONTHS[self.hdate.month.value - 1][self.hebrew],
-            hebrew_number(self.hdate.year, hebrew=self.hebrew),
+            u"יום " if hebrew else u"",
+            htables.DAYS[self.dow - 1][hebrew][0],
+            hebrew_number(hdate.day, hebrew=hebrew),
+            u"ב" if hebrew else u"",
+            htables.MONTHS[hdate.month.value - 1][hebrew],
+            hebrew_number(hdate.year, hebrew=hebrew),
         )
 
-        if 0 < self.omer_day < 50:
-            result += u" " + hebrew_number(self.omer_day, hebrew=self.hebrew)
-            result += u" " + u"בעומר" if self.hebrew else u" in the Omer"
+        omer_day = self.omer_day
+        if 0 < omer_day < 50:
+            result += u" " + hebrew_number(omer_day, hebrew=hebrew)
+            result += u" " + u"בעומר" if hebrew else u" in the Omer"
 
-        if self.holiday_description:
-            result += u" " + self.holiday_description
+        holiday_description = self.holiday_description
+        if holiday_description:
+            result += u" " + holiday_description
         return result
 
     def __repr__(self):
@@ -76,7 +261,8 @@ class HDate(BaseClass):
     def __lt__(self, other):
         """Implement the less-than operator."""
         assert isinstance(other, HDate)
-        return self.gdate < other.gdate
+        # pylint: disable=protected-access
+        return self._jdn < other._jdn
 
     def __le__(self, other):
         """Implement the less-than or equal operator."""
@@ -95,7 +281,12 @@ class HDate(BaseClass):
         """Return the hebrew date."""
         if self._last_updated == "hdate":
             return self._hdate
-        return conv.jdn_to_hdate(self._jdn)
+        self._validate_cache()
+        if self._hdate_cache is None:
+            self._hdate_cache = conv.jdn_to_hdate(self._jdn)
+        # Hand out a copy, changing it must not alter the date of this object
+        hdate = self._hdate_cache
+        return HebrewDate(hdate.year, hdate.month, hdate.day)
 
     @hdate.setter
     def hdate(self, date):
@@ -112,34 +303,96 @@ class HDate(BaseClass):
 
         self._last_updated = "hdate"
         self._hdate = date
+        self._invalidate_cache()
 
     @property
     def gdate(self):
         """Return the Gregorian date for the given Hebrew date object."""
         if self._last_updated == "gdate":
             return self._gdate
-        return conv.jdn_to_gdate(self._jdn)
+        self._validate_cache()
+        if self._gdate_cache is None:
+            self._gdate_cache = conv.jdn_to_gdate(self._jdn)
+        return self._gdate_cache
 
     @gdate.setter
     def gdate(self, date):
         """Set the Gregorian date for the given Hebrew date object."""
         self._last_updated = "gdate"
         self._gdate = date
+        self._invalidate_cache()
+
+    @property
+    def diaspora(self):
+        """Return whether the date is observed in the diaspora."""
+        return self._diaspora
+
+    @diaspora.setter
+    def diaspora(self, value):
+        """Set whether the date is observed in the diaspora."""
+        if value != self._diaspora:
+            self._diaspora = value
+            self._invalidate_cache()
+
+    @property
+    def hebrew(self):
+        """Return whether the date is represented in Hebrew."""
+        return self._hebrew
+
+    @hebrew.setter
+    def hebrew(self, value):
+        """Set whether the date is represented in Hebrew or English."""
+        if value != self._hebrew:
+            self._hebrew = value
+            # Only the text representation depends on the language
+            self._unicode_cache = None
+
+    def _validate_cache(self):
+        """Discard the memoized values if the stored date changed in place.
+
+        The hdate property returns the stored HebrewDate itself, so callers may
+        modify it without going through the setter.
+        """
+        if self._last_updated == "gdate":
+            key = self._gdate
+        else:
+            hdate = self._hdate
+            key = (hdate.year, hdate.month, hdate.day)
+        if key != self._date_key_cache:
+            self._invalidate_cache()
+            self._date_key_cache = key
+
+    def _invalidate_cache(self):
+        """Discard the values memoized for the previous date or location."""
+        self._date_key_cache = None
+        self._hdate_cache = None
+        self._gdate_cache = None
+        self._jdn_cache = None
+        self._upcoming_shabbat_cache = None
+        self._upcoming_yom_tov_cache = None
+        self._unicode_cache = None
+        self._reading_cache = None
 
     @property
     def _jdn(self):
         """Return the Julian date number for the given date."""
-        if self._last_updated == "gdate":
-            return conv.gdate_to_jdn(self.gdate)
-        return conv.hdate_to_jdn(self.hdate)
+        self._validate_cache()
+        if self._jdn_cache is None:
+            if self._last_updated == "gdate":
+                self._jdn_cache = conv.gdate_to_jdn(self._gdate)
+            else:
+                self._jdn_cache = conv.hdate_to_jdn(self._hdate)
+        return self._jdn_cache
 
     @property
     def hebrew_date(self):
         """Return the hebrew date string."""
+        hebrew = self.hebrew
+        hdate = self.hdate
         return u"{} {} {}".format(
-            hebrew_number(self.hdate.day, hebrew=self.hebrew),  # Day
-            htables.MONTHS[self.hdate.month.value - 1][self.hebrew],  # Month
-            hebrew_number(self.hdate.year, hebrew=self.hebrew),  # Year
+            hebrew_number(hdate.day, hebrew=hebrew),  # Day
+            htables.MONTHS[hdate.month.value - 1][hebrew],  # Month
+            hebrew_number(hdate.year, hebrew=hebrew),  # Year
         )
 
     @property
@@ -191,11 +444,24 @@ class HDate(BaseClass):
 
     def _holiday_entry(self):
         """Return the abstract holiday information from holidays table."""
-        holidays_list = self.get_holidays_for_year()
+        # Memoized by date and location rather than on the instance, so that
+        # the result always matches the current date.
+        hdate = self.hdate
+        diaspora = bool(self.diaspora)
+        if (hdate.day, hdate.month) not in _HOLIDAYS_BY_DATE[diaspora]:
+            # Most days of the year cannot be a holiday at all
+            return htables.HOLIDAYS[0]
+        return _holiday_entry_for_date(hdate.year, hdate.month, hdate.day, diaspora)
+
+    def _lookup_holiday_entry(self):
+        """Search the holidays table for the entry matching this date."""
+        # Only the predicates of holidays falling on this day and month need
+        # to be evaluated, there is no need to compute the whole year.
+        date = (self.hdate.day, self.hdate.month)
         holidays_list = [
             holiday
-            for holiday, holiday_hdate in holidays_list
-            if holiday_hdate.hdate == self.hdate
+            for holiday in _HOLIDAYS_BY_DATE[bool(self.diaspora)].get(date, ())
+            if all(func(self) for func in holiday.date_functions_list)
         ]
         assert len(holidays_list) <= 1
 
@@ -204,27 +470,24 @@ class HDate(BaseClass):
 
     def short_kislev(self):
         """Return whether this year has a short Kislev or not."""
-        return self.year_size() in [353, 383]
+        return self.year_size() in _SHORT_KISLEV_YEAR_SIZES
 
     @property
     def dow(self):
         """Return Hebrew day of week Sunday = 1, Saturday = 7."""
-        # datetime weekday maps Monday->0, Sunday->6; this remaps to Sunday->1.
-        return self.gdate.weekday() + 2 if self.gdate.weekday() != 6 else 1
+        return _DOW_BY_WEEKDAY[self.gdate.weekday()]
 
     def year_size(self):
         """Return the size of the given Hebrew year."""
-        return conv.get_size_of_hebrew_year(self.hdate.year)
+        return _year_info(self.hdate.year).size
 
     def rosh_hashana_dow(self):
         """Return the Hebrew day of week for Rosh Hashana."""
-        jdn = conv.hdate_to_jdn(HebrewDate(self.hdate.year, Months.Tishrei, 1))
-        return (jdn + 1) % 7 + 1
+        return _year_info(self.hdate.year).rosh_hashana_dow
 
     def pesach_dow(self):
         """Return the first day of week for Pesach."""
-        jdn = conv.hdate_to_jdn(HebrewDate(self.hdate.year, Months.Nisan, 15))
-        return (jdn + 1) % 7 + 1
+        return _year_info(self.hdate.year).pesach_dow
 
     @property
     def omer_day(self):
@@ -240,13 +503,9 @@ class HDate(BaseClass):
         """Return a tuple of mesechta and daf."""
         days_since_start_cycle_11 = (self.gdate - htables.DAF_YOMI_CYCLE_11_START).days
         page_number = days_since_start_cycle_11 % (htables.DAF_YOMI_TOTAL_PAGES)
-        for mesechta in htables.DAF_YOMI_MESECHTOS:
-            if page_number >= mesechta.pages:
-                page_number -= mesechta.pages
-            else:
-                break
-        daf_number = page_number + 2
-        return mesechta, daf_number
+        index = bisect_right(_DAF_YOMI_MESECHTA_STARTS, page_number) - 1
+        daf_number = page_number - _DAF_YOMI_MESECHTA_STARTS[index] + 2
+        return htables.DAF_YOMI_MESECHTOS[index], daf_number
 
     @property
     def daf_yomi(self):
@@ -277,9 +536,17 @@ class HDate(BaseClass):
         """
         if self.is_shabbat:
             return self
-        # If it's Sunday, fast forward to the next Shabbat.
-        saturday = self.gdate + datetime.timedelta((12 - self.gdate.weekday()) % 7)
-        return HDate(saturday, diaspora=self.diaspora, hebrew=self.hebrew)
+        self._validate_cache()
+        if self._upcoming_shabbat_cache is None:
+            # If it's Sunday, fast forward to the next Shabbat.
+            gdate = self.gdate
+            self._upcoming_shabbat_cache = gdate + datetime.timedelta(
+                _DAYS_TO_SATURDAY[gdate.weekday()]
+            )
+        # Only the date is memoized, callers may modify the returned object
+        return HDate(
+            self._upcoming_shabbat_cache, diaspora=self.diaspora, hebrew=self.hebrew
+        )
 
     @property
     def upcoming_shabbat_or_yom_tov(self):
@@ -308,8 +575,10 @@ class HDate(BaseClass):
         itself.
         """
         day_iter = self
-        while day_iter.previous_day.is_yom_tov or day_iter.previous_day.is_shabbat:
-            day_iter = day_iter.previous_day
+        previous_day = day_iter.previous_day
+        while previous_day.is_shabbat or previous_day.is_yom_tov:
+            day_iter = previous_day
+            previous_day = day_iter.previous_day
         return day_iter
 
     @property
@@ -323,8 +592,10 @@ class HDate(BaseClass):
         itself.
         """
         day_iter = self
-        while day_iter.next_day.is_yom_tov or day_iter.next_day.is_shabbat:
-            day_iter = day_iter.next_day
+        next_day = day_iter.next_day
+        while next_day.is_shabbat or next_day.is_yom_tov:
+            day_iter = next_day
+            next_day = day_iter.next_day
         return day_iter
 
     def get_holidays_for_year(self, types=None):
@@ -334,13 +605,7 @@ class HDate(BaseClass):
         """
         _LOGGER.debug("Looking up holidays of types %s", types)
         # Filter any non-related holidays depending on Israel/Diaspora only
-        holidays_list = [
-            holiday
-            for holiday in htables.HOLIDAYS
-            if (holiday.israel_diaspora == "")
-            or (holiday.israel_diaspora == "ISRAEL" and not self.diaspora)
-            or (holiday.israel_diaspora == "DIASPORA" and self.diaspora)
-        ]
+        holidays_list = _HOLIDAYS_BY_LOCATION[bool(self.diaspora)]
 
         if types:
             # Filter non-matching holiday types.
@@ -360,15 +625,6 @@ class HDate(BaseClass):
             [holiday.name for holiday in holidays_list],
         )
 
-        def holiday_dates_cross_product(holiday):
-            """Given a (days, months) pair, compute the cross product.
-
-            If days and/or months are singletons, they are converted to a list.
-            """
-            return product(
-                *([x] if isinstance(x, (int, Months)) else x for x in holiday.date)
-            )
-
         # Compute out every actual Hebrew date on which a holiday falls for
         # this year by exploding out the possible days for each holiday.
         holidays_list = [
@@ -383,7 +639,7 @@ class HDate(BaseClass):
                 ),
             )
             for holiday in holidays_list
-            for date_instance in holiday_dates_cross_product(holiday)
+            for date_instance in _holiday_dates_cross_product(holiday)
             if len(holiday.date) >= 2
         ]
         return holidays_list
@@ -397,6 +653,19 @@ class HDate(BaseClass):
         """
         if self.is_yom_tov:
             return self
+        self._validate_cache()
+        if self._upcoming_yom_tov_cache is None:
+            hdate = self._find_upcoming_yom_tov().hdate
+            self._upcoming_yom_tov_cache = (hdate.year, hdate.month, hdate.day)
+        # Only the date is memoized, callers may modify the returned object
+        return HDate(
+            heb_date=HebrewDate(*self._upcoming_yom_tov_cache),
+            diaspora=self.diaspora,
+            hebrew=self.hebrew,
+        )
+
+    def _find_upcoming_yom_tov(self):
+        """Search this year and the next one for the upcoming yom tov."""
         this_year = self.get_holidays_for_year([HolidayTypes.YOM_TOV])
         next_rosh_hashana = HDate(
             heb_date=HebrewDate(self.hdate.year + 1, Months.Tishrei, 1),
@@ -412,72 +681,77 @@ class HDate(BaseClass):
             if holiday_hdate >= self
         ]
 
-        holidays_list.sort(key=lambda h: h.gdate)
-
-        return holidays_list[0]
+        return min(holidays_list)
 
     def get_reading(self):
         """Return number of hebrew parasha."""
-        _year_type = (self.year_size() % 10) - 3
-        year_type = (
-            self.diaspora * 1000
-            + self.rosh_hashana_dow() * 100
-            + _year_type * 10
-            + self.pesach_dow()
-        )
+        self._validate_cache()
+        if self._reading_cache is None:
+            self._reading_cache = self._compute_reading()
+        return self._reading_cache
+
+    def _compute_reading(self):
+        """Compute the number of the upcoming parasha from the week of the year."""
+        year = self.hdate.year
+        diaspora = bool(self.diaspora)
+        this_year = _year_readings(year, diaspora)
 
-        _LOGGER.debug("Year type: %d", year_type)
+        _LOGGER.debug("Year type: %d", this_year.year_type)
 
         # Number of days since rosh hashana
-        rosh_hashana = HebrewDate(self.hdate.year, Months.Tishrei, 1)
-        days = self._jdn - conv.hdate_to_jdn(rosh_hashana)
+        days = self._jdn - this_year.rosh_hashana_jdn
         # Number of weeks since rosh hashana
-        weeks = (days + self.rosh_hashana_dow() - 1) // 7
+        weeks = (days + this_year.rosh_hashana_dow - 1) // 7
         _LOGGER.debug("Since Rosh Hashana - Days: %d, Weeks %d", days, weeks)
 
         # If it's currently Simchat Torah, return VeZot Haberacha.
-        if weeks == 3:
-            if (
-                days <= 22
-                and self.diaspora
-                and self.dow != 7
-                or days <= 21
-                and not self.diaspora
-            ):
-                return 54
-
-        # Special case for Simchat Torah in diaspora.
-        if weeks == 4 and days == 22 and self.diaspora:
+        if days in this_year.vezot_haberacha_days:
             return 54
 
-        # Return the indexes for the readings of the given year
-        def unpack_readings(readings):
-            return list(chain(*([x] if isinstance(x, int) else x for x in readings)))
-
-        reading_for_year = htables.READINGS[year_type]
-        readings = unpack_readings(reading_for_year)
-        # Maybe recompute the year type based on the upcoming shabbat.
+        # Maybe use the readings of next year based on the upcoming shabbat.
         # This avoids an edge case where today is before Rosh Hashana but
         # Shabbat is in a new year afterwards.
-        if (
-            weeks >= len(readings)
-            and self.hdate.year < self.upcoming_shabbat.hdate.year
-        ):
-            return self.upcoming_shabbat.get_reading()
-        return readings[weeks]
+        if weeks >= len(this_year.readings):
+            shabbat_jdn = self._jdn + 7 - self.dow
+            next_year = _year_readings(year + 1, diaspora)
+            if shabbat_jdn >= next_year.rosh_hashana_jdn:
+                days = shabbat_jdn - next_year.rosh_hashana_jdn
+                weeks = (days + next_year.rosh_hashana_dow - 1) // 7
+                return next_year.readings[weeks]
+        return this_year.readings[weeks]
+
+
+def hdates_for_range(start, end, diaspora=False, hebrew=True):
+    """Return the HDate of every day from start to end (inclusive).
+
+    Consecutive Hebrew dates are derived from each other, only the last days
+    of a month go through the full Julian day conversion. This is much cheaper
+    than creating an HDate from each Gregorian date, e.g. for a calendar page.
+    """
+    result = []
+    first_jdn = conv.gdate_to_jdn(start)
+    hebrew_date = None
+    for offset in range((end - start).days + 1):
+        jdn = first_jdn + offset
+        # Every month has at least 29 days, so up to there just move a day.
+        if hebrew_date is not None and hebrew_date.day < 29:
+            hebrew_date = HebrewDate(
+                hebrew_date.year, hebrew_date.month, hebrew_date.day + 1
+            )
+        else:
+            hebrew_date = conv.jdn_to_hdate(jdn)
+        result.append(
+            # pylint: disable=protected-access
+            HDate._from_converted_dates(
+                start + datetime.timedelta(offset), hebrew_date, jdn, diaspora, hebrew
+            )
+        )
+    return result
 
 
-def hebrew_number(num, hebrew=True, short=False):
-    """Return "Gimatria" number."""
-    if not hebrew:
-        return str(num)
-    if not 0 <= num < 10000:
-        raise ValueError("num must be between 0 to 9999, got:{}".format(num))
+def _hebrew_number_below_1000(num):
+    """Return the letters of a number between 0 and 999, without punctuation."""
     hstring = u""
-    if num >= 1000:
-        hstring += htables.DIGITS[0][num // 1000]
-        hstring += u"' "
-        num = num % 1000
     while num >= 400:
         hstring += htables.DIGITS[2][4]
         num = num - 400
@@ -485,12 +759,27 @@ def hebrew_number(num, hebrew=True, short=False):
         hstring += htables.DIGITS[2][num // 100]
         num = num % 100
     if num >= 10:
-        if num in [15, 16]:
+        if num in (15, 16):
             num = num - 9
         hstring += htables.DIGITS[1][num // 10]
         num = num % 10
     if num > 0:
         hstring += htables.DIGITS[0][num]
+    return hstring
+
+
+_HEBREW_NUMBERS = tuple(_hebrew_number_below_1000(num) for num in range(1000))
+
+
+def hebrew_number(num, hebrew=True, short=False):
+    """Return "Gimatria" number."""
+    if not hebrew:
+        return str(num)
+    if not 0 <= num < 10000:
+        raise ValueError("num must be between 0 to 9999, got:{}".format(num))
+    hstring = _HEBREW_NUMBERS[num % 1000]
+    if num >= 1000:
+        hstring = htables.DIGITS[0][num // 1000] + u"' " + hstring
     # possibly add the ' and " to hebrew numbers
     if not short:
         if len(hstring) < 2:
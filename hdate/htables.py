@@ -2,12 +2,14 @@
 """Constant lookup tables for hdate modules."""
 
 import datetime
+import functools
 from collections import namedtuple
 from enum import Enum
+from itertools import chain
 
 READING = namedtuple("READING", "year_type, readings")
 
-READINGS = (
+_RAW_READINGS = (
     READING(
         [1725],
         (
@@ -218,7 +220,18 @@ READINGS = (
     ),
 )
 
-READINGS = dict((year_type, r.readings) for r in READINGS for year_type in r.year_type)
+
+def _unpack_readings(readings):
+    """Return a readings sequence as a flat tuple of parasha indexes."""
+    return tuple(chain(*([x] if isinstance(x, int) else x for x in readings)))
+
+
+# Keyed by the individual year type, so a reading lookup is a single dict get.
+READINGS = dict(
+    (year_type, _unpack_readings(r.readings))
+    for r in _RAW_READINGS
+    for year_type in r.year_type
+)
 
 DIGITS = (
     (u" ", u"א", u"ב", u"ג", u"ד", u"ה", u"ו", u"ז", u"ח", u"ט"),
@@ -341,6 +354,26 @@ class Months(Enum):
     Adar_II = 14
 
 
+def _shared_predicate(factory):
+    """Return the same predicate object for identical factory arguments.
+
+    Predicates only capture their (hashable) arguments, so equal calls, which
+    repeat across the holidays table, can share a single function.
+    """
+    predicates = {}
+
+    @functools.wraps(factory)
+    def wrapper(*args):
+        try:
+            return predicates[args]
+        except KeyError:
+            predicate = predicates[args] = factory(*args)
+            return predicate
+
+    return wrapper
+
+
+@_shared_predicate
 def year_is_after(year):
     """
     Return a lambda function.
@@ -351,6 +384,7 @@ def year_is_after(year):
     return lambda x: x.hdate.year > year
 
 
+@_shared_predicate
 def year_is_before(year):
     """
     Return a lambda function.
@@ -361,6 +395,7 @@ def year_is_before(year):
     return lambda x: x.hdate.year < year
 
 
+@_shared_predicate
 def move_if_not_on_dow(original, replacement, dow_not_orig, dow_replacement):
     """
     Return a lambda function.
@@ -374,6 +409,26 @@ def move_if_not_on_dow(original, replacement, dow_not_orig, dow_replacement):
     )
 
 
+@_shared_predicate
+def move_if_not_on_dows(original, *moves):
+    """
+    Return a lambda function.
+
+    Each move is a (replacement, dow_not_orig, dow_replacement) tuple, as
+    accepted by move_if_not_on_dow. Lambda checks that either the original
+    day falls on none of the moves' weekdays, or that one of the replacement
+    days falls on its expected weekday.
+    """
+    dows_not_orig = frozenset(dow_not_orig for _, dow_not_orig, _ in moves)
+    replacements = frozenset(
+        (replacement, dow_replacement) for replacement, _, dow_replacement in moves
+    )
+    return lambda x: (
+        (x.hdate.day == original and x.gdate.weekday() not in dows_not_orig)
+        or (x.hdate.day, x.gdate.weekday()) in replacements
+    )
+
+
 HOLIDAY = namedtuple(
     "HOLIDAY",
     ["type", "name", "date", "israel_diaspora", "date_functions_list", "description"],
@@ -396,13 +451,13 @@ class HolidayTypes(Enum):
 
 
 HOLIDAYS = (
-    HOLIDAY(HolidayTypes.UNKNOWN, "", (), "", [], LANG(u"", DESC(u"", u""))),
+    HOLIDAY(HolidayTypes.UNKNOWN, "", (), "", (), LANG(u"", DESC(u"", u""))),
     HOLIDAY(
         HolidayTypes.EREV_YOM_TOV,
         "erev_rosh_hashana",
         (29, Months.Elul),
         "",
-        [],
+        (),
         LANG(u"Erev Rosh Hashana", DESC(u"ערב ראש השנה", u'ערב ר"ה')),
     ),
     HOLIDAY(
@@ -410,7 +465,7 @@ HOLIDAYS = (
         "rosh_hashana_i",
         (1, Months.Tishrei),
         "",
-        [],
+        (),
         LANG(u"Rosh Hashana I", DESC(u"א' ראש השנה", u'א ר"ה')),
     ),
     HOLIDAY(
@@ -418,15 +473,15 @@ HOLIDAYS = (
         "rosh_hashana_ii",
         (2, Months.Tishrei),
         "",
-        [],
+        (),
         LANG(u"Rosh Hashana II", DESC(u"ב' ראש השנה", u"ב' ר\"ה")),
     ),
     HOLIDAY(
         HolidayTypes.FAST_DAY,
         "tzom_gedaliah",
-        ([3, 4], Months.Tishrei),
+        ((3, 4), Months.Tishrei),
         "",
-        [move_if_not_on_dow(3, 4, 5, 6)],
+        (move_if_not_on_dow(3, 4, 5, 6),),
         LANG(u"Tzom Gedaliah", DESC(u"צום גדליה", u"צום גדליה")),
     ),
     HOLIDAY(
@@ -434,7 +489,7 @@ HOLIDAYS = (
         "erev_yom_kippur",
         (9, Months.Tishrei),
         "",
-        [],
+        (),
         LANG(u"Erev Yom Kippur", DESC(u'עיוה"כ', u'עיוה"כ')),
     ),
     HOLIDAY(
@@ -442,7 +497,7 @@ HOLIDAYS = (
         "yom_kippur",
         (10, Months.Tishrei),
         "",
-        [],
+        (),
         LANG(u"Yom Kippur", DESC(u"יום הכפורים", u'יוה"כ')),
     ),
     HOLIDAY(
@@ -450,7 +505,7 @@ HOLIDAYS = (
         "erev_sukkot",
         (14, Months.Tishrei),
         "",
-        [],
+        (),
         LANG(u"Erev Sukkot", DESC(u"ערב סוכות", u"ערב סוכות")),
     ),
     HOLIDAY(
@@ -458,7 +513,7 @@ HOLIDAYS = (
         "sukkot",
         (15, Months.Tishrei),
         "",
-        [],
+        (),
         LANG(u"Sukkot", DESC(u"סוכות", u"סוכות")),
     ),
     HOLIDAY(
@@ -466,15 +521,15 @@ HOLIDAYS = (
         "hol_hamoed_sukkot",
         (16, Months.Tishrei),
         "ISRAEL",
-        "",
+        (),
         LANG(u"Hol hamoed Sukkot", DESC(u"חול המועד סוכות", u'חוה"מ סוכות')),
     ),
     HOLIDAY(
         HolidayTypes.HOL_HAMOED,
         "hol_hamoed_sukkot",
-        ([17, 18, 19, 20], Months.Tishrei),
-        "",
+        ((17, 18, 19, 20), Months.Tishrei),
         "",
+        (),
         LANG(u"Hol hamoed Sukkot", DESC(u"חול המועד סוכות", u'חוה"מ סוכות')),
     ),
     HOLIDAY(
@@ -482,7 +537,7 @@ HOLIDAYS = (
         "hoshana_raba",
         (21, Months.Tishrei),
         "",
-        [],
+        (),
         LANG(u"Hoshana Raba", DESC(u"הושענא רבה", u'הוש"ר')),
     ),
     HOLIDAY(
@@ -490,27 +545,27 @@ HOLIDAYS = (
         "simchat_torah",
         (23, Months.Tishrei),
         "DIASPORA",
-        [],
+        (),
         LANG(u"Simchat Torah", DESC(u"שמחת תורה", u'שמח"ת')),
     ),
     HOLIDAY(
         HolidayTypes.MELACHA_PERMITTED_HOLIDAY,
         "chanukah",
-        (list(range(25, 30)), Months.Kislev),
+        ((25, 26, 27, 28, 29, 30), Months.Kislev),
         "",
-        [],
+        (),
         LANG(u"Chanukah", DESC(u"חנוכה", u"חנוכה")),
     ),
     HOLIDAY(
         HolidayTypes.MELACHA_PERMITTED_HOLIDAY,
         "chanukah",
-        ([1, 2, 3], Months.Tevet),
+        ((1, 2, 3), Months.Tevet),
         "",
-        [
+        (
             lambda x: (
-                (x.short_kislev() and x.hdate.day == 3) or (x.hdate.day in [1, 2])
-            )
-        ],
+                (x.short_kislev() and x.hdate.day == 3) or (x.hdate.day in (1, 2))
+            ),
+        ),
         LANG(u"Chanukah", DESC(u"חנוכה", u"חנוכה")),
     ),
     HOLIDAY(
@@ -518,7 +573,7 @@ HOLIDAYS = (
         "asara_btevet",
         (10, Months.Tevet),
         "",
-        [],
+        (),
         LANG(u"Asara B'Tevet", DESC(u"צום עשרה בטבת", u"י' בטבת")),
     ),
     HOLIDAY(
@@ -526,31 +581,31 @@ HOLIDAYS = (
         "tu_bshvat",
         (15, Months.Shvat),
         "",
-        [],
+        (),
         LANG(u"Tu B'Shvat", DESC(u'ט"ו בשבט', u'ט"ו בשבט')),
     ),
     HOLIDAY(
         HolidayTypes.FAST_DAY,
         "taanit_esther",
-        ([11, 13], [Months.Adar, Months.Adar_II]),
+        ((11, 13), (Months.Adar, Months.Adar_II)),
         "",
-        [move_if_not_on_dow(13, 11, 5, 3)],
+        (move_if_not_on_dow(13, 11, 5, 3),),
         LANG(u"Ta'anit Esther", DESC(u"תענית אסתר", u"תענית אסתר")),
     ),
     HOLIDAY(
         HolidayTypes.MELACHA_PERMITTED_HOLIDAY,
         "purim",
-        (14, [Months.Adar, Months.Adar_II]),
+        (14, (Months.Adar, Months.Adar_II)),
         "",
-        [],
+        (),
         LANG(u"Purim", DESC(u"פורים", u"פורים")),
     ),
     HOLIDAY(
         HolidayTypes.MELACHA_PERMITTED_HOLIDAY,
         "shushan_purim",
-        (15, [Months.Adar, Months.Adar_II]),
+        (15, (Months.Adar, Months.Adar_II)),
         "",
-        [],
+        (),
         LANG(u"Shushan Purim", DESC(u"שושן פורים", u"שושן פורים")),
     ),
     HOLIDAY(
@@ -558,7 +613,7 @@ HOLIDAYS = (
         "erev_pesach",
         (14, Months.Nisan),
         "",
-        [],
+        (),
         LANG(u"Erev Pesach", DESC(u"ערב פסח", u"ערב פסח")),
     ),
     HOLIDAY(
@@ -566,7 +621,7 @@ HOLIDAYS = (
         "pesach",
         (15, Months.Nisan),
         "",
-        "",
+        (),
         LANG(u"Pesach", DESC(u"פסח", u"פסח")),
     ),
     HOLIDAY(
@@ -574,15 +629,15 @@ HOLIDAYS = (
         "hol_hamoed_pesach",
         (16, Months.Nisan),
         "ISRAEL",
-        [],
+        (),
         LANG(u"Hol hamoed Pesach", DESC(u"חול המועד פסח", u'חוה"מ פסח')),
     ),
     HOLIDAY(
         HolidayTypes.HOL_HAMOED,
         "hol_hamoed_pesach",
-        ([17, 18, 19], Months.Nisan),
+        ((17, 18, 19), Months.Nisan),
         "",
-        [],
+        (),
         LANG(u"Hol hamoed Pesach", DESC(u"חול המועד פסח", u'חוה"מ פסח')),
     ),
     HOLIDAY(
@@ -590,7 +645,7 @@ HOLIDAYS = (
         "hol_hamoed_pesach",
         (20, Months.Nisan),
         "",
-        [],
+        (),
         LANG(u"Hol hamoed Pesach", DESC(u"חול המועד פסח", u'חוה"מ פסח')),
     ),
     HOLIDAY(
@@ -598,32 +653,30 @@ HOLIDAYS = (
         "pesach_vii",
         (21, Months.Nisan),
         "",
-        [],
+        (),
         LANG(u"Pesach VII", DESC(u"שביעי פסח", u"ז' פסח")),
     ),
     HOLIDAY(
         HolidayTypes.MODERN_HOLIDAY,
         "yom_haatzmaut",
-        ([3, 4, 5], Months.Iyyar),
+        ((3, 4, 5), Months.Iyyar),
         "",
-        [
+        (
             year_is_after(5708),
             year_is_before(5764),
-            move_if_not_on_dow(5, 4, 4, 3) or move_if_not_on_dow(5, 3, 5, 3),
-        ],
+            move_if_not_on_dows(5, (4, 4, 3), (3, 5, 3)),
+        ),
         LANG(u"Yom HaAtzma'ut", DESC(u"יום העצמאות", u"יום העצמאות")),
     ),
     HOLIDAY(
         HolidayTypes.MODERN_HOLIDAY,
         "yom_haatzmaut",
-        ([3, 4, 5, 6], Months.Iyyar),
+        ((3, 4, 5, 6), Months.Iyyar),
         "",
-        [
+        (
             year_is_after(5763),
-            move_if_not_on_dow(5, 4, 4, 3)
-            or move_if_not_on_dow(5, 3, 5, 3)
-            or move_if_not_on_dow(5, 6, 0, 1),
-        ],
+            move_if_not_on_dows(5, (4, 4, 3), (3, 5, 3), (6, 0, 1)),
+        ),
         LANG(u"Yom HaAtzma'ut", DESC(u"יום העצמאות", u"יום העצמאות")),
     ),
     HOLIDAY(
@@ -631,7 +684,7 @@ HOLIDAYS = (
         "lag_bomer",
         (18, Months.Iyyar),
         "",
-        [],
+        (),
         LANG(u"Lag B'Omer", DESC(u'ל"ג בעומר', u'ל"ג בעומר')),
     ),
     HOLIDAY(
@@ -639,7 +692,7 @@ HOLIDAYS = (
         "erev_shavuot",
         (5, Months.Sivan),
         "",
-        [],
+        (),
         LANG(u"Erev Shavuot", DESC(u"ערב שבועות", u"ערב שבועות")),
     ),
     HOLIDAY(
@@ -647,23 +700,23 @@ HOLIDAYS = (
         "shavuot",
         (6, Months.Sivan),
         "",
-        [],
+        (),
         LANG(u"Shavuot", DESC(u"שבועות", u"שבועות")),
     ),
     HOLIDAY(
         HolidayTypes.FAST_DAY,
         "tzom_tammuz",
-        ([17, 18], Months.Tammuz),
+        ((17, 18), Months.Tammuz),
         "",
-        [move_if_not_on_dow(17, 18, 5, 6)],
+        (move_if_not_on_dow(17, 18, 5, 6),),
         LANG(u"Tzom Tammuz", DESC(u"צום שבעה עשר בתמוז", u"צום תמוז")),
     ),
     HOLIDAY(
         HolidayTypes.FAST_DAY,
         "tisha_bav",
-        ([9, 10], Months.Av),
+        ((9, 10), Months.Av),
         "",
-        [move_if_not_on_dow(9, 10, 5, 6)],
+        (move_if_not_on_dow(9, 10, 5, 6),),
         LANG(u"Tish'a B'Av", DESC(u"תשעה באב", u"ט' באב")),
     ),
     HOLIDAY(
@@ -671,43 +724,41 @@ HOLIDAYS = (
         "tu_bav",
         (15, Months.Av),
         "",
-        [],
+        (),
         LANG(u"Tu B'Av", DESC(u'ט"ו באב', u'ט"ו באב')),
     ),
     HOLIDAY(
         HolidayTypes.MEMORIAL_DAY,
         "yom_hashoah",
-        ([26, 27, 28], Months.Nisan),
+        ((26, 27, 28), Months.Nisan),
         "",
-        [
-            move_if_not_on_dow(27, 28, 6, 0) or move_if_not_on_dow(27, 26, 4, 3),
+        (
+            move_if_not_on_dows(27, (28, 6, 0), (26, 4, 3)),
             year_is_after(5718),
-        ],
+        ),
         LANG(u"Yom HaShoah", DESC(u"יום השואה", u"יום השואה")),
     ),
     HOLIDAY(
         HolidayTypes.MEMORIAL_DAY,
         "yom_hazikaron",
-        ([2, 3, 4], Months.Iyyar),
+        ((2, 3, 4), Months.Iyyar),
         "",
-        [
+        (
             year_is_after(5708),
             year_is_before(5764),
-            move_if_not_on_dow(4, 3, 3, 2) or move_if_not_on_dow(4, 2, 4, 2),
-        ],
+            move_if_not_on_dows(4, (3, 3, 2), (2, 4, 2)),
+        ),
         LANG(u"Yom HaZikaron", DESC(u"יום הזכרון", u"יום הזכרון")),
     ),
     HOLIDAY(
         HolidayTypes.MEMORIAL_DAY,
         "yom_hazikaron",
-        ([2, 3, 4, 5], Months.Iyyar),
+        ((2, 3, 4, 5), Months.Iyyar),
         "",
-        [
+        (
             year_is_after(5763),
-            move_if_not_on_dow(4, 3, 3, 2)
-            or move_if_not_on_dow(4, 2, 4, 2)
-            or move_if_not_on_dow(4, 5, 6, 0),
-        ],
+            move_if_not_on_dows(4, (3, 3, 2), (2, 4, 2), (5, 6, 0)),
+        ),
         LANG(u"Yom HaZikaron", DESC(u"יום הזכרון", u"יום הזכרון")),
     ),
     HOLIDAY(
@@ -715,7 +766,7 @@ HOLIDAYS = (
         "yom_yerushalayim",
         (28, Months.Iyyar),
         "",
-        [year_is_after(5727)],
+        (year_is_after(5727),),
         LANG(u"Yom Yerushalayim", DESC(u"יום ירושלים", u"יום י-ם")),
     ),
     HOLIDAY(
@@ -723,7 +774,7 @@ HOLIDAYS = (
         "shmini_atzeret",
         (22, Months.Tishrei),
         "",
-        [],
+        (),
         LANG(u"Shmini Atzeret", DESC(u"שמיני עצרת", u"שמיני עצרת")),
     ),
     HOLIDAY(
@@ -731,7 +782,7 @@ HOLIDAYS = (
         "pesach_viii",
         (22, Months.Nisan),
         "DIASPORA",
-        [],
+        (),
         LANG(u"Pesach VIII", DESC(u"אחרון של פסח", u"אחרון של פסח")),
     ),
     HOLIDAY(
@@ -739,7 +790,7 @@ HOLIDAYS = (
         "shavuot_ii",
         (7, Months.Sivan),
         "DIASPORA",
-        [],
+        (),
         LANG(u"Shavuot II", DESC(u"שני של שבועות", u"ב' שבועות")),
     ),
     HOLIDAY(
@@ -747,7 +798,7 @@ HOLIDAYS = (
         "sukkot_ii",
         (16, Months.Tishrei),
         "DIASPORA",
-        [],
+        (),
         LANG(u"Sukkot II", DESC(u"שני של סוכות", u"ב' סוכות")),
     ),
     HOLIDAY(
@@ -755,7 +806,7 @@ HOLIDAYS = (
         "pesach_ii",
         (16, Months.Nisan),
         "DIASPORA",
-        [],
+        (),
         LANG(u"Pesach II", DESC(u"שני של פסח", u"ב' פסח")),
     ),
     HOLIDAY(
@@ -763,15 +814,15 @@ HOLIDAYS = (
         "family_day",
         (30, Months.Shvat),
         "ISRAEL",
-        [year_is_after(5734)],
+        (year_is_after(5734),),
         LANG(u"Family Day", DESC(u"יום המשפחה", u"יום המשפחה")),
     ),
     HOLIDAY(
         HolidayTypes.MEMORIAL_DAY,
         "memorial_day_unknown",
-        (7, [Months.Adar, Months.Adar_II]),
+        (7, (Months.Adar, Months.Adar_II)),
         "ISRAEL",
-        [],
+        (),
         LANG(
             u"Memorial day for fallen whose place of burial is unknown",
             DESC(u"יום זכרון...", u"יום זכרון..."),
@@ -780,9 +831,9 @@ HOLIDAYS = (
     HOLIDAY(
         HolidayTypes.MEMORIAL_DAY,
         "rabin_memorial_day",
-        ([11, 12], Months.Marcheshvan),
+        ((11, 12), Months.Marcheshvan),
         "ISRAEL",
-        [move_if_not_on_dow(12, 11, 4, 3), year_is_after(5757)],
+        (move_if_not_on_dow(12, 11, 4, 3), year_is_after(5757)),
         LANG(
             u"Yitzhak Rabin memorial day",
             DESC(u"יום הזכרון ליצחק רבין", u"יום הזכרון ליצחק רבין"),
@@ -793,7 +844,7 @@ HOLIDAYS = (
         "zeev_zhabotinsky_day",
         (29, Months.Tammuz),
         "ISRAEL",
-        [year_is_after(5764)],
+        (year_is_after(5764),),
         LANG(u"Zeev Zhabotinsky day", DESC(u"יום ז'בוטינסקי", u"יום ז'בוטינסקי")),
     ),
 )
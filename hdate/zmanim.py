@@ -44,7 +44,7 @@ class Zmanim(BaseClass):
     # pylint: disable=too-many-arguments
     def __init__(
         self,
-        date=dt.datetime.now(),
+        date=None,
         location=Location(),
         hebrew=True,
         candle_lighting_offset=18,
@@ -59,7 +59,7 @@ class Zmanim(BaseClass):
 
         The time zone information is appended to the date received based on the
         location object. After which it is transformed to UTC for all internal
-        calculations.
+        calculations. If no date is given, the current time is used.
         """
         self.location = location
         self.hebrew = hebrew
@@ -72,6 +72,8 @@ class Zmanim(BaseClass):
         # If timezone aware is received as date, we expect it to match the
         # timezone specified by location, so it can be overridden and changed
         # to UTC for calculations as above.
+        if date is None:
+            date = dt.datetime.now()
         if isinstance(date, dt.datetime):
             _LOGGER.debug("Date input is of type datetime: %r", date)
             self.date = date.date()
@@ -9,6 +9,7 @@ import pytest
 
 import hdate.converters as conv
 from hdate import HDate, HebrewDate
+from hdate.date import hdates_for_range
 from hdate.htables import Months
 
 # pylint: disable=no-self-use
@@ -67,6 +68,9 @@ class TestHDate(object):
     def default_values(self):
         return HDate()
 
+    def test_default_date_is_today(self):
+        assert HDate().gdate == datetime.date.today()
+
     def test_assign_bad_hdate_value(self):
         bad_day_value = HebrewDate(5779, 10, 35)
         with pytest.raises(TypeError):
@@ -135,6 +139,87 @@ class TestHDate(object):
         )
         assert (rand_hdate.next_day.gdate - rand_hdate.gdate) == datetime.timedelta(1)
 
+    def test_equality_ignores_cached_values(self):
+        first = HDate(gdate=datetime.date(2018, 9, 10))
+        second = HDate(gdate=datetime.date(2018, 9, 10))
+        assert first.is_yom_tov
+        assert first == second
+
+    def test_hdate_changed_in_place(self):
+        # The stored Hebrew date is the object returned by hdate
+        hd = HDate(heb_date=HebrewDate(5779, Months.Tishrei, 1), hebrew=False)
+        assert hd.gdate == datetime.date(2018, 9, 10)
+        assert str(hd) == "Monday 1 Tishrei 5779 Rosh Hashana I"
+        hd.hdate.day = 10
+        assert hd.gdate == datetime.date(2018, 9, 19)
+        assert str(hd) == "Wednesday 10 Tishrei 5779 Yom Kippur"
+
+    def test_holiday_follows_date_changed_in_place(self):
+        hd = HDate(heb_date=HebrewDate(5779, Months.Tishrei, 1))
+        assert hd.holiday_name == "rosh_hashana_i"
+        hd.hdate.day = 10
+        assert hd.holiday_name == "yom_kippur"
+        hd.hdate.day = 11
+        assert hd.holiday_name == ""
+
+    def test_hdate_is_a_copy_after_setting_gdate(self):
+        # The Hebrew date derived from a Gregorian one is handed out as a copy
+        hd = HDate()
+        hd.gdate = datetime.date(2018, 9, 10)
+        hd.hdate.day = 10
+        assert hd.hdate == HebrewDate(5779, Months.Tishrei, 1)
+        assert hd.gdate == datetime.date(2018, 9, 10)
+
+    def test_comparison_operators(self):
+        rosh_hashana = HDate(heb_date=HebrewDate(5779, Months.Tishrei, 1))
+        same_day = HDate(gdate=datetime.date(2018, 9, 10))
+        next_day = HDate(gdate=datetime.date(2018, 9, 11))
+        assert rosh_hashana < next_day
+        assert rosh_hashana <= next_day
+        assert next_day > rosh_hashana
+        assert next_day >= rosh_hashana
+        assert not rosh_hashana < same_day
+        assert rosh_hashana <= same_day
+        assert rosh_hashana >= same_day
+
+    @pytest.mark.parametrize("diaspora", [False, True])
+    def test_hdates_for_range(self, diaspora):
+        start = datetime.date(2018, 8, 1)
+        end = datetime.date(2019, 10, 31)
+        days = hdates_for_range(start, end, diaspora=diaspora, hebrew=False)
+        assert len(days) == (end - start).days + 1
+        for offset, day in enumerate(days):
+            expected = HDate(
+                start + datetime.timedelta(offset), diaspora=diaspora, hebrew=False
+            )
+            assert day == expected
+            assert day.gdate == expected.gdate
+            assert day.hdate == expected.hdate
+            assert day.holiday_name == expected.holiday_name
+
+    def test_upcoming_shabbat_follows_settings(self):
+        hd = HDate(gdate=datetime.date(2018, 12, 2), hebrew=True)
+        assert hd.upcoming_shabbat.hebrew
+        hd.hebrew = False
+        assert not hd.upcoming_shabbat.hebrew
+        hd.gdate = datetime.date(2018, 12, 9)
+        assert hd.upcoming_shabbat.gdate == datetime.date(2018, 12, 15)
+
+    def test_upcoming_days_are_not_shared(self):
+        hd = HDate(gdate=datetime.date(2018, 12, 2), hebrew=True)
+        shabbat = hd.upcoming_shabbat
+        shabbat.gdate = datetime.date(2019, 1, 1)
+        shabbat.hebrew = False
+        assert hd.upcoming_shabbat.gdate == datetime.date(2018, 12, 8)
+        assert hd.upcoming_shabbat.hebrew
+
+        yom_tov = hd.upcoming_yom_tov
+        yom_tov.hdate.day = 1
+        assert hd.upcoming_yom_tov.hdate == HebrewDate(5779, Months.Nisan, 15)
+        yom_tov.gdate = datetime.date(2019, 1, 1)
+        assert hd.upcoming_yom_tov.hdate == HebrewDate(5779, Months.Nisan, 15)
+        assert hd.upcoming_yom_tov.gdate == datetime.date(2019, 4, 20)
+
 
 class TestSpecialDays(object):
 
@@ -200,6 +285,19 @@ class TestSpecialDays(object):
         ([(30, 5)], (5734, 6500), "family_day"),
     ]
 
+    MOVED_NEW_HOLIDAYS = [
+        # Gregorian date, name
+        ((1950, 4, 20), "yom_haatzmaut"),  # 5 Iyyar on Shabbat
+        ((1950, 4, 22), ""),
+        ((2001, 4, 19), "yom_hashoah"),  # 27 Nisan on Friday
+        ((2001, 4, 20), ""),
+        ((2001, 4, 25), "yom_hazikaron"),
+        ((2001, 4, 26), "yom_haatzmaut"),
+        ((2001, 4, 28), ""),
+        ((2004, 4, 26), "yom_hazikaron"),  # 5 Iyyar on Monday
+        ((2004, 4, 27), "yom_haatzmaut"),
+    ]
+
     ADAR_HOLIDAYS = [
         ([11, 13], "taanit_esther"),
         ([14], "purim"),
@@ -346,6 +444,10 @@ class TestSpecialDays(object):
             date_under_test.hdate = HebrewDate(year, date[1], date[0])
             assert date_under_test.holiday_name == ""
 
+    @pytest.mark.parametrize("date, holiday", MOVED_NEW_HOLIDAYS)
+    def test_new_holidays_moved(self, date, holiday):
+        assert HDate(datetime.date(*date)).holiday_name == holiday
+
     def test_get_holiday_hanuka_3rd_tevet(self):
         year = random.randint(5000, 6000)
         year_size = conv.get_size_of_hebrew_year(year)
@@ -356,6 +458,12 @@ class TestSpecialDays(object):
         else:
             assert myhdate.holiday_name == ""
 
+    def test_get_holiday_hanuka_30th_kislev(self):
+        # Kislev 5780 has 30 days, the sixth day of the holiday
+        myhdate = HDate(heb_date=HebrewDate(5780, Months.Kislev, 30))
+        assert myhdate.gdate == datetime.date(2019, 12, 28)
+        assert myhdate.holiday_name == "chanukah"
+
     @pytest.mark.parametrize("possible_days, holiday", ADAR_HOLIDAYS)
     def test_get_holiday_adar(self, possible_days, holiday):
         year = random.randint(5000, 6000)
@@ -38,6 +38,9 @@ class TestZmanim(object):
         with pytest.raises(TypeError):
             Zmanim(date="bad value")
 
+    def test_default_date_is_today(self):
+        assert Zmanim().date == datetime.date.today()
+
     @pytest.mark.parametrize("execution_number", list(range(5)))
     def test_same_doy_is_equal(self, execution_number, random_date):
         other_year = random.randint(500, 3000)